@@ -995,10 +995,8 @@ class Decoder:
         numOrderLegs = int(fields.pop(0))
         o.orderComboLegs = []
         for _ in range(numOrderLegs):
-            leg = OrderComboLeg()
-            leg.price = fields.pop(0)
-            self.parse(leg)
-            o.orderComboLegs.append(leg)
+            price = fields.pop(0)
+            o.orderComboLegs.append(OrderComboLeg(float(price or UNSET_DOUBLE)))
 
         numParams = int(fields.pop(0))
         if numParams > 0:
@@ -1247,10 +1245,8 @@ class Decoder:
         numOrderLegs = int(fields.pop(0))
         o.orderComboLegs = []
         for _ in range(numOrderLegs):
-            leg = OrderComboLeg()
-            leg.price = fields.pop(0)
-            self.parse(leg)
-            o.orderComboLegs.append(leg)
+            price = fields.pop(0)
+            o.orderComboLegs.append(OrderComboLeg(float(price or UNSET_DOUBLE)))
 
         numParams = int(fields.pop(0))
         if numParams > 0:
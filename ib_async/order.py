@@ -1,17 +1,23 @@
 """Order types used by Interactive Brokers."""
 
-from dataclasses import dataclass, field
-from typing import ClassVar, FrozenSet, List, NamedTuple
+from dataclasses import MISSING, dataclass, field, fields
+from typing import Any, ClassVar, Dict, FrozenSet, List, NamedTuple, Type
 
 from eventkit import Event
 
 from .contract import Contract, TagValue
 from .objects import Fill, SoftDollarTier, TradeLogEntry
-from .util import UNSET_DOUBLE, UNSET_INTEGER, dataclassNonDefaults
+from .util import UNSET_DOUBLE, UNSET_INTEGER
 
 
-@dataclass
-class Order:
+class _WeakRefSlots:
+    # dataclass slots leave out __weakref__ (weakref_slot needs
+    # Python 3.11), so the slotted classes get it from this base
+    __slots__ = ("__weakref__",)
+
+
+@dataclass(slots=True)
+class Order(_WeakRefSlots):
     """
     Order for trading contracts.
 
@@ -158,26 +164,48 @@ class Order:
     midOffsetAtWhole: float = UNSET_DOUBLE
     midOffsetAtHalf: float = UNSET_DOUBLE
 
-    def __repr__(self):
-        attrs = dataclassNonDefaults(self)
-        if self.__class__ is not Order:
-            attrs.pop("orderType", None)
-        if not self.softDollarTier:
-            attrs.pop("softDollarTier")
-        clsName = self.__class__.__qualname__
-        kwargs = ", ".join(f"{k}={v!r}" for k, v in attrs.items())
-        return f"{clsName}({kwargs})"
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
 
-    __str__ = __repr__
 
-    def __eq__(self, other):
-        return self is other
+def _createOrderRepr():
+    """
+    Generate the ``__repr__`` of :class:`.Order` with the default check
+    of every field inlined. It shows only the fields with a non-default
+    value, like ``dataclassNonDefaults``, but without scanning the fields
+    on every call. The order type is left out for the subclasses and the
+    soft dollar tier is left out when empty.
+    """
+    ns: Dict[str, Any] = {"Order": Order}
+    lines = ["def __repr__(self):", "    parts = []", "    append = parts.append"]
+    for i, f in enumerate(fields(Order)):
+        if f.name == "softDollarTier":
+            cond = "v"
+        else:
+            cond = "v == v and not (isinstance(v, (list, dict)) and not v)"
+            if f.default is not MISSING:
+                ns[f"_d{i}"] = f.default
+                cond = f"v is not _d{i} and v != _d{i} and {cond}"
+            if f.name == "orderType":
+                cond = f"self.__class__ is Order and {cond}"
+        lines += [
+            f"    v = self.{f.name}",
+            f"    if {cond}:",
+            f'        append("{f.name}=" + repr(v))',
+        ]
+    lines.append(
+        '    return self.__class__.__qualname__ + "(" + ", ".join(parts) + ")"'
+    )
+    exec("\n".join(lines), ns)
+    return ns["__repr__"]
 
-    def __hash__(self):
-        return id(self)
+
+Order.__repr__ = Order.__str__ = _createOrderRepr()  # type: ignore
 
 
 class LimitOrder(Order):
+    __slots__ = ()
+
     def __init__(self, action: str, totalQuantity: float, lmtPrice: float, **kwargs):
         Order.__init__(
             self,
@@ -190,6 +218,8 @@ class LimitOrder(Order):
 
 
 class MarketOrder(Order):
+    __slots__ = ()
+
     def __init__(self, action: str, totalQuantity: float, **kwargs):
         Order.__init__(
             self, orderType="MKT", action=action, totalQuantity=totalQuantity, **kwargs
@@ -197,6 +227,8 @@ class MarketOrder(Order):
 
 
 class StopOrder(Order):
+    __slots__ = ()
+
     def __init__(self, action: str, totalQuantity: float, stopPrice: float, **kwargs):
         Order.__init__(
             self,
@@ -209,6 +241,8 @@ class StopOrder(Order):
 
 
 class StopLimitOrder(Order):
+    __slots__ = ()
+
     def __init__(
         self,
         action: str,
@@ -228,8 +262,8 @@ class StopLimitOrder(Order):
         )
 
 
-@dataclass
-class OrderStatus:
+@dataclass(slots=True)
+class OrderStatus(_WeakRefSlots):
     orderId: int = 0
     status: str = ""
     filled: float = 0.0
@@ -260,8 +294,8 @@ class OrderStatus:
     )
 
 
-@dataclass
-class OrderState:
+@dataclass(slots=True)
+class OrderState(_WeakRefSlots):
     status: str = ""
     initMarginBefore: str = ""
     maintMarginBefore: str = ""
@@ -281,13 +315,60 @@ class OrderState:
     completedStatus: str = ""
 
 
-@dataclass
-class OrderComboLeg:
+@dataclass(slots=True)
+class OrderComboLeg(_WeakRefSlots):
     price: float = UNSET_DOUBLE
 
 
-@dataclass
-class Trade:
+class _LazyEvent:
+    # event descriptor that creates the event in its private slot on
+    # first access, which spares short-lived trades that are never
+    # observed from constructing them
+    __slots__ = ("name", "slot")
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.slot = "_" + name
+
+    def __get__(self, obj, objtype=None) -> Event:
+        if obj is None:
+            return self  # type: ignore
+        try:
+            return getattr(obj, self.slot)
+        except AttributeError:
+            event = Event(self.name)
+            setattr(obj, self.slot, event)
+            return event
+
+    def __set__(self, obj, event: Event):
+        setattr(obj, self.slot, event)
+
+
+class _TradeEventSlots:
+    # dataclass slots only cover the fields, so the events that
+    # Trade creates on first use need slots of their own
+    __slots__ = (
+        "__weakref__",
+        "_statusEvent",
+        "_modifyEvent",
+        "_fillEvent",
+        "_commissionReportEvent",
+        "_filledEvent",
+        "_cancelEvent",
+        "_cancelledEvent",
+    )
+
+    statusEvent = _LazyEvent()
+    modifyEvent = _LazyEvent()
+    fillEvent = _LazyEvent()
+    commissionReportEvent = _LazyEvent()
+    filledEvent = _LazyEvent()
+    cancelEvent = _LazyEvent()
+    cancelledEvent = _LazyEvent()
+
+
+@dataclass(slots=True)
+class Trade(_TradeEventSlots):
     """
     Trade keeps track of an order, its status and all its fills.
 
@@ -319,15 +400,6 @@ class Trade:
         "cancelledEvent",
     )
 
-    def __post_init__(self):
-        self.statusEvent = Event("statusEvent")
-        self.modifyEvent = Event("modifyEvent")
-        self.fillEvent = Event("fillEvent")
-        self.commissionReportEvent = Event("commissionReportEvent")
-        self.filledEvent = Event("filledEvent")
-        self.cancelEvent = Event("cancelEvent")
-        self.cancelledEvent = Event("cancelledEvent")
-
     def isActive(self) -> bool:
         """True if eligible for execution, false otherwise."""
         return self.orderStatus.status in OrderStatus.ActiveStates
@@ -338,11 +410,16 @@ class Trade:
 
     def filled(self) -> float:
         """Number of shares filled."""
-        fills = self.fills
+        total = 0.0
         if self.contract.secType == "BAG":
             # don't count fills for the leg contracts
-            fills = [f for f in fills if f.contract.secType == "BAG"]
-        return sum(f.execution.shares for f in fills)
+            for f in self.fills:
+                if f.contract.secType == "BAG":
+                    total += f.execution.shares
+        else:
+            for f in self.fills:
+                total += f.execution.shares
+        return total
 
     def remaining(self) -> float:
         """Number of shares remaining to be filled."""
@@ -355,30 +432,22 @@ class BracketOrder(NamedTuple):
     stopLoss: Order
 
 
-@dataclass
-class OrderCondition:
+@dataclass(slots=True)
+class OrderCondition(_WeakRefSlots):
     @staticmethod
     def createClass(condType):
-        d = {
-            1: PriceCondition,
-            3: TimeCondition,
-            4: MarginCondition,
-            5: ExecutionCondition,
-            6: VolumeCondition,
-            7: PercentChangeCondition,
-        }
-        return d[condType]
+        return _CONDITION_TYPES[condType]
 
     def And(self):
-        self.conjunction = "a"
+        self.conjunction = "a"  # type: ignore
         return self
 
     def Or(self):
-        self.conjunction = "o"
+        self.conjunction = "o"  # type: ignore
         return self
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceCondition(OrderCondition):
     condType: int = 1
     conjunction: str = "a"
@@ -389,7 +458,7 @@ class PriceCondition(OrderCondition):
     triggerMethod: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class TimeCondition(OrderCondition):
     condType: int = 3
     conjunction: str = "a"
@@ -397,7 +466,7 @@ class TimeCondition(OrderCondition):
     time: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class MarginCondition(OrderCondition):
     condType: int = 4
     conjunction: str = "a"
@@ -405,7 +474,7 @@ class MarginCondition(OrderCondition):
     percent: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionCondition(OrderCondition):
     condType: int = 5
     conjunction: str = "a"
@@ -414,7 +483,7 @@ class ExecutionCondition(OrderCondition):
     symbol: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class VolumeCondition(OrderCondition):
     condType: int = 6
     conjunction: str = "a"
@@ -424,7 +493,7 @@ class VolumeCondition(OrderCondition):
     exch: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class PercentChangeCondition(OrderCondition):
     condType: int = 7
     conjunction: str = "a"
@@ -432,3 +501,13 @@ class PercentChangeCondition(OrderCondition):
     changePercent: float = 0.0
     conId: int = 0
     exch: str = ""
+
+
+_CONDITION_TYPES: Dict[int, Type[OrderCondition]] = {
+    1: PriceCondition,
+    3: TimeCondition,
+    4: MarginCondition,
+    5: ExecutionCondition,
+    6: VolumeCondition,
+    7: PercentChangeCondition,
+}
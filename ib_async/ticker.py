@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from math import isnan
 from typing import ClassVar, List, Optional, Union
 
 from eventkit import Event, Op
@@ -18,13 +19,20 @@ from ib_async.objects import (
     TickByTickMidPoint,
     TickData,
 )
-from ib_async.util import dataclassRepr, isNan
+from ib_async.util import dataclassRepr
 
 nan = float("nan")
 
 
-@dataclass
-class Ticker:
+class _TickerEventSlots:
+    # dataclass slots only cover the fields, so the event that
+    # Ticker creates in __post_init__ needs a slot of its own, and
+    # weak references need __weakref__
+    __slots__ = ("updateEvent", "__weakref__")
+
+
+@dataclass(slots=True)
+class Ticker(_TickerEventSlots):
     """
     Current market data such as bid, ask, last price, etc. for a contract.
 
@@ -125,13 +133,10 @@ class Ticker:
     snapshotPermissions: int = 0
 
     def __post_init__(self):
-        self.updateEvent = TickerUpdateEvent("updateEvent")
-
-    def __eq__(self, other):
-        return self is other
+        self.updateEvent = TickerUpdateEvent("updateEvent")  # type: ignore
 
-    def __hash__(self):
-        return id(self)
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
 
     __repr__ = dataclassRepr
     __str__ = dataclassRepr
@@ -140,10 +145,10 @@ class Ticker:
         """See if this ticker has a valid bid and ask."""
         return (
             self.bid != -1
-            and not isNan(self.bid)
+            and not isnan(self.bid)
             and self.bidSize > 0
             and self.ask != -1
-            and not isNan(self.ask)
+            and not isnan(self.ask)
             and self.askSize > 0
         )
 
@@ -297,7 +302,7 @@ class TimeBars(Op):
         if not self.bars:
             return
         bar = self.bars[-1]
-        if isNan(bar.open):
+        if isnan(bar.open):
             bar.open = bar.high = bar.low = price
         bar.high = max(bar.high, price)
         bar.low = min(bar.low, price)
@@ -309,7 +314,7 @@ class TimeBars(Op):
     def _on_timer(self, time):
         if self.bars:
             bar = self.bars[-1]
-            if isNan(bar.close) and len(self.bars) > 1:
+            if isnan(bar.close) and len(self.bars) > 1:
                 bar.open = bar.high = bar.low = bar.close = self.bars[-2].close
             self.bars.updateEvent.emit(self.bars, True)
             self.emit(bar)
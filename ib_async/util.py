@@ -8,7 +8,18 @@ import signal
 import sys
 import time
 from dataclasses import fields, is_dataclass
-from typing import AsyncIterator, Awaitable, Callable, Iterator, List, Optional, Union
+from operator import attrgetter
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
+from weakref import WeakKeyDictionary
 
 import eventkit as ev
 
@@ -29,6 +40,10 @@ UNSET_DOUBLE = sys.float_info.max
 
 Time_t = Union[dt.time, dt.datetime]
 
+# weakly keyed, so that classes created on the fly can still be freed
+_fieldDefaultsCache: "WeakKeyDictionary[type, tuple]" = WeakKeyDictionary()
+_isNamedTupleCache: "WeakKeyDictionary[type, bool]" = WeakKeyDictionary()
+
 
 def df(objs, labels: Optional[List[str]] = None):
     """
@@ -44,8 +59,10 @@ def df(objs, labels: Optional[List[str]] = None):
         objs = list(objs)
         obj = objs[0]
         if is_dataclass(obj):
-            df = pd.DataFrame.from_records(dataclassAsTuple(o) for o in objs)
-            df.columns = [field.name for field in fields(obj)]
+            # build the frame column by column rather than row by row
+            names, _, getValues = _fieldDefaults(type(obj))
+            columns = zip(*[getValues(o) for o in objs])
+            df = pd.DataFrame(dict(zip(names, map(list, columns))))
         elif isinstance(obj, DynamicObject):
             df = pd.DataFrame.from_records(o.__dict__ for o in objs)
         else:
@@ -60,8 +77,8 @@ def df(objs, labels: Optional[List[str]] = None):
         df = None
 
     if labels:
-        exclude = [label for label in df if label not in labels]
-        df = df.drop(exclude, axis=1)
+        labelSet = set(labels)
+        df = df[[label for label in df.columns if label in labelSet]]
 
     return df
 
@@ -74,7 +91,8 @@ def dataclassAsDict(obj) -> dict:
     if not is_dataclass(obj):
         raise TypeError(f"Object {obj} is not a dataclass")
 
-    return {field.name: getattr(obj, field.name) for field in fields(obj)}
+    names, _, getValues = _fieldDefaults(type(obj))
+    return dict(zip(names, getValues(obj)))
 
 
 def dataclassAsTuple(obj) -> tuple:
@@ -85,7 +103,8 @@ def dataclassAsTuple(obj) -> tuple:
     if not is_dataclass(obj):
         raise TypeError(f"Object {obj} is not a dataclass")
 
-    return tuple(getattr(obj, field.name) for field in fields(obj))
+    _, _, getValues = _fieldDefaults(type(obj))
+    return getValues(obj)
 
 
 def dataclassNonDefaults(obj) -> dict:
@@ -96,18 +115,46 @@ def dataclassNonDefaults(obj) -> dict:
     if not is_dataclass(obj):
         raise TypeError(f"Object {obj} is not a dataclass")
 
-    values = [getattr(obj, field.name) for field in fields(obj)]
+    names, defaults, getValues = _fieldDefaults(type(obj))
+    nonDefaults = {}
+    for name, value, default in zip(names, getValues(obj), defaults):
+        if value is default:
+            # fast path for fields that still hold the shared default
+            # object, such as UNSET_DOUBLE or UNSET_INTEGER
+            continue
+        if (
+            value != default
+            and value == value
+            and not (
+                (isinstance(value, list) and value == [])
+                or (isinstance(value, dict) and value == {})
+            )
+        ):
+            nonDefaults[name] = value
+
+    return nonDefaults
+
+
+def _fieldDefaults(cls) -> tuple:
+    """
+    Return the field names and the field defaults of the given dataclass
+    type as parallel tuples, together with a getter that returns the field
+    values of an instance as a tuple. Cached per type.
+    """
+    cached = _fieldDefaultsCache.get(cls)
+    if cached is None:
+        names = tuple(field.name for field in fields(cls))
+        defaults = tuple(field.default for field in fields(cls))
+        getValues: Callable[[object], tuple]
+        if len(names) > 1:
+            getValues = attrgetter(*names)
+        else:
+            # attrgetter returns a bare value for a single name
+            getValues = lambda obj: tuple(getattr(obj, n) for n in names)  # noqa
 
-    return {
-        field.name: value
-        for field, value in zip(fields(obj), values)
-        if value != field.default
-        and value == value
-        and not (
-            (isinstance(value, list) and value == [])
-            or (isinstance(value, dict) and value == {})
-        )
-    }
+        cached = names, defaults, getValues
+        _fieldDefaultsCache[cls] = cached
+    return cached
 
 
 def dataclassUpdate(obj, *srcObjs, **kwargs) -> object:
@@ -118,10 +165,14 @@ def dataclassUpdate(obj, *srcObjs, **kwargs) -> object:
     if not is_dataclass(obj):
         raise TypeError(f"Object {obj} is not a dataclass")
 
+    # use setattr so that dataclasses with slots can be updated too
     for srcObj in srcObjs:
-        obj.__dict__.update(dataclassAsDict(srcObj))  # type: ignore
+        names, _, getValues = _fieldDefaults(type(srcObj))
+        for k, v in zip(names, getValues(srcObj)):
+            setattr(obj, k, v)
 
-    obj.__dict__.update(**kwargs)  # type: ignore
+    for k, v in kwargs.items():
+        setattr(obj, k, v)
     return obj
 
 
@@ -132,13 +183,20 @@ def dataclassRepr(obj) -> str:
     """
     attrs = dataclassNonDefaults(obj)
     clsName = obj.__class__.__qualname__
-    kwargs = ", ".join(f"{k}={v!r}" for k, v in attrs.items())
+    kwargs = ", ".join([f"{k}={v!r}" for k, v in attrs.items()])
     return f"{clsName}({kwargs})"
 
 
 def isnamedtupleinstance(x):
     """From https://stackoverflow.com/a/2166841/6067848"""
     t = type(x)
+    result = _isNamedTupleCache.get(t)
+    if result is None:
+        result = _isNamedTupleCache[t] = _isNamedTupleType(t)
+    return result
+
+
+def _isNamedTupleType(t: type) -> bool:
     b = t.__bases__
     if len(b) != 1 or b[0] != tuple:
         return False
@@ -155,6 +213,10 @@ def tree(obj):
     Convert object to a tree of lists, dicts and simple values.
     The result can be serialized to JSON.
     """
+    convert = _treeConverters.get(type(obj))
+    if convert is not None:
+        return convert(obj)
+
     if isinstance(obj, (bool, int, float, str, bytes)):
         return obj
 
@@ -176,6 +238,16 @@ def tree(obj):
     return str(obj)
 
 
+# fast path of tree for the exact built-in types, which
+# saves going through the isinstance checks for every node
+_treeConverters: Dict[type, Callable] = {
+    **dict.fromkeys((bool, int, float, str, bytes), lambda obj: obj),
+    **dict.fromkeys((dt.date, dt.datetime, dt.time), lambda obj: obj.isoformat()),
+    dict: lambda obj: {k: tree(v) for k, v in obj.items()},
+    **dict.fromkeys((list, tuple, set), lambda obj: [tree(i) for i in obj]),
+}
+
+
 def barplot(bars, title="", upColor="blue", downColor="red"):
     """
     Create candlestick plot for the given bars. The bars can be given as
@@ -183,7 +255,7 @@ def barplot(bars, title="", upColor="blue", downColor="red"):
     """
     import pandas as pd
     import matplotlib.pyplot as plt
-    from matplotlib.lines import Line2D
+    from matplotlib.collections import LineCollection, PatchCollection
     from matplotlib.patches import Rectangle
 
     if isinstance(bars, pd.DataFrame):
@@ -197,6 +269,13 @@ def barplot(bars, title="", upColor="blue", downColor="red"):
     ax.set_title(title)
     ax.grid(True)
     fig.set_size_inches(10, 6)
+
+    # collect all wicks and bodies and add them as two collections,
+    # which is much faster than adding an artist per line and patch
+    wicks = []
+    wickColors = []
+    bodies = []
+    bodyColors = []
     for n, (open_, high, low, close) in enumerate(ohlcTups):
         if close >= open_:
             color = upColor
@@ -204,20 +283,22 @@ def barplot(bars, title="", upColor="blue", downColor="red"):
         else:
             color = downColor
             bodyHi, bodyLo = open_, close
-        line = Line2D(xdata=(n, n), ydata=(low, bodyLo), color=color, linewidth=1)
-        ax.add_line(line)
-        line = Line2D(xdata=(n, n), ydata=(high, bodyHi), color=color, linewidth=1)
-        ax.add_line(line)
-        rect = Rectangle(
-            xy=(n - 0.3, bodyLo),
-            width=0.6,
-            height=bodyHi - bodyLo,
-            edgecolor=color,
-            facecolor=color,
+        wicks += [((n, low), (n, bodyLo)), ((n, high), (n, bodyHi))]
+        wickColors += [color, color]
+        bodies.append(
+            Rectangle(xy=(n - 0.3, bodyLo), width=0.6, height=bodyHi - bodyLo)
+        )
+        bodyColors.append(color)
+    ax.add_collection(LineCollection(wicks, colors=wickColors, linewidths=1))
+    ax.add_collection(
+        PatchCollection(
+            bodies,
+            edgecolors=bodyColors,
+            facecolors=bodyColors,
             alpha=0.4,
             antialiased=True,
         )
-        ax.add_patch(rect)
+    )
 
     ax.autoscale_view()
     return fig
@@ -225,7 +306,8 @@ def barplot(bars, title="", upColor="blue", downColor="red"):
 
 def allowCtrlC():
     """Allow Control-C to end program."""
-    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    if signal.getsignal(signal.SIGINT) is not signal.SIG_DFL:
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
 
 
 def logToFile(path, level=logging.INFO):
@@ -269,6 +351,9 @@ def isNan(x: float) -> bool:
     return x != x
 
 
+_siTemplates = ("%.2f", "%.1f", "%.0f")
+
+
 def formatSI(n: float) -> str:
     """Format the integer or float n to 3 significant digits + SI prefix."""
     s = ""
@@ -282,15 +367,12 @@ def formatSI(n: float) -> str:
         s = "0.00 "
     else:
         assert n < 9.99e26
-        log = int(math.floor(math.log10(n)))
-        i, j = divmod(log, 3)
-        for _try in range(2):
-            templ = "%.{}f".format(2 - j)
-            val = templ % (n * 10 ** (-3 * i))
-            if val != "1000":
-                break
+        i, j = divmod(math.floor(math.log10(n)), 3)
+        val = _siTemplates[j] % (n * 10 ** (-3 * i))
+        if val == "1000":
+            # rounded up into the next prefix
             i += 1
-            j = 0
+            val = "%.2f" % (n * 10 ** (-3 * i))
         s += val + " "
         if i != 0:
             s += "yzafpnum kMGTPEZY"[i + 8]
@@ -299,16 +381,17 @@ def formatSI(n: float) -> str:
 
 
 class timeit:
-    """Context manager for timing."""
+    """Context manager for timing, using the monotonic performance counter."""
 
     def __init__(self, title="Run"):
         self.title = title
 
     def __enter__(self):
-        self.t0 = time.time()
+        self.t0 = time.perf_counter_ns()
 
     def __exit__(self, *_args):
-        print(self.title + " took " + formatSI(time.time() - self.t0) + "s")
+        secs = (time.perf_counter_ns() - self.t0) / 1e9
+        print(self.title + " took " + formatSI(secs) + "s")
 
 
 def run(*awaitables: Awaitable, timeout: Optional[float] = None):
@@ -367,6 +450,8 @@ def run(*awaitables: Awaitable, timeout: Optional[float] = None):
 
 
 def _fillDate(time: Time_t) -> dt.datetime:
+    if type(time) is dt.datetime:
+        return time
     # use today if date is absent
     if isinstance(time, dt.time):
         t = dt.datetime.combine(dt.date.today(), time)
@@ -423,8 +508,9 @@ def timeRange(start: Time_t, end: Time_t, step: float) -> Iterator[dt.datetime]:
     t = _fillDate(start)
     tz = dt.timezone.utc if t.tzinfo else None
     now = dt.datetime.now(tz)
-    while t < now:
-        t += delta
+    if t < now:
+        # skip ahead to the first time point that is not in the past
+        t -= (t - now) // delta * delta
 
     while t <= _fillDate(end):
         waitUntil(t)
@@ -440,8 +526,7 @@ def waitUntil(t: Time_t) -> bool:
         t: The time t can be specified as datetime.datetime,
             or as datetime.time in which case today is used as the date.
     """
-    now = dt.datetime.now(t.tzinfo)
-    secs = (_fillDate(t) - now).total_seconds()
+    secs = _fillDate(t).timestamp() - time.time()
     run(asyncio.sleep(secs))
     return True
 
@@ -456,8 +541,9 @@ async def timeRangeAsync(
     t = _fillDate(start)
     tz = dt.timezone.utc if t.tzinfo else None
     now = dt.datetime.now(tz)
-    while t < now:
-        t += delta
+    if t < now:
+        # skip ahead to the first time point that is not in the past
+        t -= (t - now) // delta * delta
 
     while t <= _fillDate(end):
         await waitUntilAsync(t)
@@ -467,8 +553,7 @@ async def timeRangeAsync(
 
 async def waitUntilAsync(t: Time_t) -> bool:
     """Async version of :meth:`waitUntil`."""
-    now = dt.datetime.now(t.tzinfo)
-    secs = (_fillDate(t) - now).total_seconds()
+    secs = _fillDate(t).timestamp() - time.time()
     await asyncio.sleep(secs)
 
     return True
@@ -541,19 +626,30 @@ def formatIBDatetime(t: Union[dt.date, dt.datetime, str, None]) -> str:
         s = ""
     elif isinstance(t, dt.datetime):
         # convert to UTC timezone
-        t = t.astimezone(tz=dt.timezone.utc)
-        s = t.strftime("%Y%m%d %H:%M:%S UTC")
+        s = _formatUTC(t.astimezone(tz=dt.timezone.utc))
     elif isinstance(t, dt.date):
         t = dt.datetime(t.year, t.month, t.day, 23, 59, 59).astimezone(
             tz=dt.timezone.utc
         )
-        s = t.strftime("%Y%m%d %H:%M:%S UTC")
+        s = _formatUTC(t)
     else:
         s = t
 
     return s
 
 
+def _formatUTC(t: dt.datetime) -> str:
+    # %-formatting the fields is much faster than strftime
+    return "%04d%02d%02d %02d:%02d:%02d UTC" % (
+        t.year,
+        t.month,
+        t.day,
+        t.hour,
+        t.minute,
+        t.second,
+    )
+
+
 def parseIBDatetime(s: str) -> Union[dt.date, dt.datetime]:
     """Parse string in IB date or datetime format to datetime."""
     if len(s) == 8:
@@ -567,13 +663,28 @@ def parseIBDatetime(s: str) -> Union[dt.date, dt.datetime]:
     elif s.count(" ") >= 2 and "  " not in s:
         # 20221125 10:00:00 Europe/Amsterdam
         s0, s1, s2 = s.split(" ", 2)
-        t = dt.datetime.strptime(s0 + s1, "%Y%m%d%H:%M:%S")
+        t = _parseDatetime(s0 + s1)
         t = t.replace(tzinfo=ZoneInfo(s2))
     else:
         # YYYYmmdd  HH:MM:SS
         # or
         # YYYY-mm-dd HH:MM:SS.0
         ss = s.replace(" ", "").replace("-", "")[:16]
-        t = dt.datetime.strptime(ss, "%Y%m%d%H:%M:%S")
+        t = _parseDatetime(ss)
 
     return t
+
+
+def _parseDatetime(s: str) -> dt.datetime:
+    """Parse string in ``YYYYmmddHH:MM:SS`` format to datetime."""
+    if len(s) == 16 and s[10] == ":" and s[13] == ":":
+        # slicing is much faster than strptime
+        return dt.datetime(
+            int(s[0:4]),
+            int(s[4:6]),
+            int(s[6:8]),
+            int(s[8:10]),
+            int(s[11:13]),
+            int(s[14:16]),
+        )
+    return dt.datetime.strptime(s, "%Y%m%d%H:%M:%S")
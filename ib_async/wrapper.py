@@ -2,9 +2,11 @@
 
 import asyncio
 import logging
+import sys
 from collections import defaultdict
 from contextlib import suppress
 from datetime import datetime, timezone
+from math import isnan
 from typing import Any, Dict, List, Optional, Set, TYPE_CHECKING, Tuple, Union, cast
 
 from ib_async.contract import (
@@ -61,11 +63,11 @@ from ib_async.ticker import Ticker
 from ib_async.util import (
     UNSET_DOUBLE,
     UNSET_INTEGER,
+    _fieldDefaults,
     dataclassAsDict,
     dataclassUpdate,
     getLoop,
     globalErrorEvent,
-    isNan,
     parseIBDatetime,
 )
 
@@ -75,6 +77,33 @@ if TYPE_CHECKING:
 
 OrderKeyType = Union[int, Tuple[int, int]]
 
+# tick types that only set a price field of the ticker
+_priceTickFields: Dict[int, str] = {
+    6: "high",
+    72: "high",
+    7: "low",
+    73: "low",
+    9: "close",
+    75: "close",
+    14: "open",
+    76: "open",
+    15: "low13week",
+    16: "high13week",
+    17: "low26week",
+    18: "high26week",
+    19: "low52week",
+    20: "high52week",
+    35: "auctionPrice",
+    37: "markPrice",
+    50: "bidYield",
+    103: "bidYield",
+    51: "askYield",
+    104: "askYield",
+    52: "lastYield",
+}
+
+_warningCodes = frozenset({110, 165, 202, 399, 404, 434, 492, 10167})
+
 
 class RequestError(Exception):
     """
@@ -134,8 +163,8 @@ class Wrapper:
     reqId2Ticker: Dict[int, Ticker]
     """ reqId -> Ticker """
 
-    ticker2ReqId: Dict[Union[int, str], Dict[Ticker, int]]
-    """ tickType -> Ticker -> reqId """
+    ticker2ReqId: Dict[Tuple[Union[int, str], Ticker], int]
+    """ (tickType, Ticker) -> reqId """
 
     reqId2Subscriber: Dict[int, Any]
     """ live bars or live scan data """
@@ -190,7 +219,7 @@ class Wrapper:
         self.tickers = {}
         self.pendingTickers = set()
         self.reqId2Ticker = {}
-        self.ticker2ReqId = defaultdict(dict)
+        self.ticker2ReqId = {}
         self.reqId2Subscriber = {}
         self.reqId2PnL = {}
         self.reqId2PnlSingle = {}
@@ -212,15 +241,7 @@ class Wrapper:
         events = [ticker.updateEvent for ticker in self.tickers.values()]
         events += [sub.updateEvent for sub in self.reqId2Subscriber.values()]
         for trade in self.trades.values():
-            events += [
-                trade.statusEvent,
-                trade.modifyEvent,
-                trade.fillEvent,
-                trade.filledEvent,
-                trade.commissionReportEvent,
-                trade.cancelEvent,
-                trade.cancelledEvent,
-            ]
+            events += [getattr(trade, name) for name in Trade.events]
         for event in events:
             event.set_done()
 
@@ -272,11 +293,11 @@ class Wrapper:
 
         self.reqId2Ticker[reqId] = ticker
         self._reqId2Contract[reqId] = contract
-        self.ticker2ReqId[tickType][ticker] = reqId
+        self.ticker2ReqId[tickType, ticker] = reqId
         return ticker
 
     def endTicker(self, ticker: Ticker, tickType: Union[int, str]):
-        reqId = self.ticker2ReqId[tickType].pop(ticker, 0)
+        reqId = self.ticker2ReqId.pop((tickType, ticker), 0)
         self._reqId2Contract.pop(reqId, None)
         return reqId
 
@@ -409,7 +430,7 @@ class Wrapper:
         else:
             portfolioItems[contract.conId] = portfItem
 
-        self._logger.info(f"updatePortfolio: {portfItem}")
+        self._logger.info("updatePortfolio: %s", portfItem)
         self.ib.updatePortfolioEvent.emit(portfItem)
 
     def position(
@@ -424,7 +445,7 @@ class Wrapper:
         else:
             positions[contract.conId] = position
 
-        self._logger.info(f"position: {position}")
+        self._logger.info("position: %s", position)
         results = self._results.get("positions")
 
         if results is not None:
@@ -508,15 +529,18 @@ class Wrapper:
                 trade.order.orderType = order.orderType
                 trade.order.orderRef = order.orderRef
             else:
-                # ignore '?' values in the order
-                order = Order(
-                    **{k: v for k, v in dataclassAsDict(order).items() if v != "?"}
-                )
+                # reset '?' values in the order to their defaults
+                names, defaults, getValues = _fieldDefaults(Order)
+                for name, value, default in zip(names, getValues(order), defaults):
+                    if value == "?":
+                        setattr(order, name, default)
                 contract = Contract.create(**dataclassAsDict(contract))
-                orderStatus = OrderStatus(orderId=orderId, status=orderState.status)
+                orderStatus = OrderStatus(
+                    orderId=orderId, status=sys.intern(orderState.status)
+                )
                 trade = Trade(contract, order, orderStatus, [], [])
                 self.trades[key] = trade
-                self._logger.info(f"openOrder: {trade}")
+                self._logger.info("openOrder: %s", trade)
 
             self.permId2Trade.setdefault(order.permId, trade)
             results = self._results.get("openOrders")
@@ -537,7 +561,9 @@ class Wrapper:
 
     def completedOrder(self, contract: Contract, order: Order, orderState: OrderState):
         contract = Contract.create(**dataclassAsDict(contract))
-        orderStatus = OrderStatus(orderId=order.orderId, status=orderState.status)
+        orderStatus = OrderStatus(
+            orderId=order.orderId, status=sys.intern(orderState.status)
+        )
         trade = Trade(contract, order, orderStatus, [], [])
         self._results["completedOrders"].append(trade)
 
@@ -562,28 +588,53 @@ class Wrapper:
         whyHeld: str,
         mktCapPrice: float = 0.0,
     ):
+        # interned status strings make the OrderStatus state lookups
+        # resolve on identity
+        status = sys.intern(status)
         key = self.orderKey(clientId, orderId, permId)
         trade = self.trades.get(key)
         if trade:
             msg: Optional[str]
-            oldStatus = trade.orderStatus.status
-            new = dict(
-                status=status,
-                filled=filled,
-                remaining=remaining,
-                avgFillPrice=avgFillPrice,
-                permId=permId,
-                parentId=parentId,
-                lastFillPrice=lastFillPrice,
-                clientId=clientId,
-                whyHeld=whyHeld,
-                mktCapPrice=mktCapPrice,
+            orderStatus = trade.orderStatus
+            oldStatus = orderStatus.status
+            new = (
+                status,
+                filled,
+                remaining,
+                avgFillPrice,
+                permId,
+                parentId,
+                lastFillPrice,
+                clientId,
+                whyHeld,
+                mktCapPrice,
+            )
+            curr = (
+                orderStatus.status,
+                orderStatus.filled,
+                orderStatus.remaining,
+                orderStatus.avgFillPrice,
+                orderStatus.permId,
+                orderStatus.parentId,
+                orderStatus.lastFillPrice,
+                orderStatus.clientId,
+                orderStatus.whyHeld,
+                orderStatus.mktCapPrice,
             )
-            curr = dataclassAsDict(trade.orderStatus)
-            isChanged = curr != {**curr, **new}
 
-            if isChanged:
-                dataclassUpdate(trade.orderStatus, **new)
+            if curr != new:
+                (
+                    orderStatus.status,
+                    orderStatus.filled,
+                    orderStatus.remaining,
+                    orderStatus.avgFillPrice,
+                    orderStatus.permId,
+                    orderStatus.parentId,
+                    orderStatus.lastFillPrice,
+                    orderStatus.clientId,
+                    orderStatus.whyHeld,
+                    orderStatus.mktCapPrice,
+                ) = new
                 msg = ""
             elif (
                 status == "Submitted"
@@ -598,7 +649,7 @@ class Wrapper:
             if msg is not None:
                 logEntry = TradeLogEntry(self.lastTime, status, msg)
                 trade.log.append(logEntry)
-                self._logger.info(f"orderStatus: {trade}")
+                self._logger.info("orderStatus: %s", trade)
                 self.ib.orderStatusEvent.emit(trade)
                 trade.statusEvent.emit(trade)
                 if status != oldStatus:
@@ -618,7 +669,7 @@ class Wrapper:
         This wrapper handles both live fills and responses to
         reqExecutions.
         """
-        self._logger.info(f"execDetails {execution}")
+        self._logger.info("execDetails %s", execution)
         if execution.orderId == UNSET_INTEGER:
             # bug in TWS: executions of manual orders have unset value
             execution.orderId = 0
@@ -649,7 +700,7 @@ class Wrapper:
                 )
                 trade.log.append(logEntry)
                 if isLive:
-                    self._logger.info(f"execDetails: {fill}")
+                    self._logger.info("execDetails: %s", fill)
                     self.ib.execDetailsEvent.emit(trade, fill)
                     trade.fillEvent(trade, fill)
 
@@ -669,7 +720,7 @@ class Wrapper:
         fill = self.fills.get(commissionReport.execId)
         if fill:
             report = dataclassUpdate(fill.commissionReport, commissionReport)
-            self._logger.info(f"commissionReport: {report}")
+            self._logger.info("commissionReport: %s", report)
             trade = self.permId2Trade.get(fill.execution.permId)
             if trade:
                 self.ib.commissionReportEvent.emit(trade, fill, report)
@@ -824,36 +875,10 @@ class Wrapper:
             if size != ticker.lastSize:
                 ticker.prevLastSize = ticker.lastSize
                 ticker.lastSize = size
-        elif tickType in {6, 72}:
-            ticker.high = price
-        elif tickType in {7, 73}:
-            ticker.low = price
-        elif tickType in {9, 75}:
-            ticker.close = price
-        elif tickType in {14, 76}:
-            ticker.open = price
-        elif tickType == 15:
-            ticker.low13week = price
-        elif tickType == 16:
-            ticker.high13week = price
-        elif tickType == 17:
-            ticker.low26week = price
-        elif tickType == 18:
-            ticker.high26week = price
-        elif tickType == 19:
-            ticker.low52week = price
-        elif tickType == 20:
-            ticker.high52week = price
-        elif tickType == 35:
-            ticker.auctionPrice = price
-        elif tickType == 37:
-            ticker.markPrice = price
-        elif tickType in {50, 103}:
-            ticker.bidYield = price
-        elif tickType in {51, 104}:
-            ticker.askYield = price
-        elif tickType == 52:
-            ticker.lastYield = price
+        else:
+            field = _priceTickFields.get(tickType)
+            if field:
+                setattr(ticker, field, price)
 
         if price or size:
             tick = TickData(self.lastTime, tickType, price, size)
@@ -883,7 +908,7 @@ class Wrapper:
             ticker.askSize = size
         elif tickType in {5, 71}:
             price = ticker.last
-            if isNan(price):
+            if isnan(price):
                 return
             if size != ticker.lastSize:
                 ticker.prevLastSize = ticker.lastSize
@@ -952,7 +977,7 @@ class Wrapper:
             price,
             size,
             tickAttribLast,
-            exchange,
+            sys.intern(exchange),
             specialConditions,
         )
 
@@ -1165,31 +1190,36 @@ class Wrapper:
         # assert list(dom.keys()) == list(range(0, len(dom))), f"Keys aren't sequential? {dom} :: {ticker}"
         # fmt: on
 
+        # The dict values are also kept as lists for users to consume in
+        # ticker.domBids and ticker.domAsks. Since the positions are normally
+        # sequential, each operation maps to a single edit of the list, with
+        # a full rebuild from the dict as fallback if they have diverged.
+        levels = ticker.domBids if side else ticker.domAsks
+
         if operation in {0, 1}:
             # '0' is INSERT NEW
             # '1' is UPDATE EXISTING
             # We are using the same operation for "insert or overwrite" directly.
-            dom[position] = DOMLevel(price, size, marketMaker)
+            level = DOMLevel(price, size, marketMaker)
+            old = dom.get(position)
+            dom[position] = level
+            if old is None and len(levels) == len(dom) - 1:
+                levels.append(level)
+            elif old is not None and position < len(levels) and levels[position] is old:
+                levels[position] = level
+            else:
+                levels[:] = dom.values()
         elif operation == 2:
             # '2' is DELETE EXISTING
             size = 0
-            try:
+            # an invalid position requested for removal is ignored
+            if position in dom:
                 level = dom.pop(position)
                 price = level.price
-            except:
-                # invalid position requested for removal, so ignore the request
-                pass
-
-        # To retain the original API structure, we convert all sorted dict
-        # values into lists for users to consume.
-        # Users can also read ticker.domBidsDict or ticker.domAsksDict directly.
-        values = list(dom.values())
-        if side:
-            # Update BID for users
-            ticker.domBids = values
-        else:
-            # Update ASK for users
-            ticker.domAsks = values
+                if position < len(levels) and levels[position] is level:
+                    del levels[position]
+                else:
+                    levels[:] = dom.values()
 
         # TODO: add optional debugging check. In a correctly working system, we should
         #       technically always have sequential bid and ask position entries, but
@@ -1320,7 +1350,9 @@ class Wrapper:
         headline: str,
         extraData: str,
     ):
-        news = NewsTick(timeStamp, providerCode, articleId, headline, extraData)
+        news = NewsTick(
+            timeStamp, sys.intern(providerCode), articleId, headline, extraData
+        )
         self.newsTicks.append(news)
         self.ib.tickNewsEvent.emit(news)
 
@@ -1333,7 +1365,7 @@ class Wrapper:
     ):
         dt = parseIBDatetime(time)
         dt = cast(datetime, dt)
-        article = HistoricalNews(dt, providerCode, articleId, headline)
+        article = HistoricalNews(dt, sys.intern(providerCode), articleId, headline)
         self._results[reqId].append(article)
 
     def historicalNewsEnd(self, reqId, _hasMore: bool):
@@ -1401,8 +1433,7 @@ class Wrapper:
         # https://interactivebrokers.github.io/tws-api/message_codes.html
         isRequest = reqId in self._futures
         trade = self.trades.get((self.clientId, reqId))
-        warningCodes = {110, 165, 202, 399, 404, 434, 492, 10167}
-        isWarning = errorCode in warningCodes or 2100 <= errorCode < 2200
+        isWarning = errorCode in _warningCodes or 2100 <= errorCode < 2200
         if errorCode == 110 and isRequest:
             # whatIf request failed
             isWarning = False
@@ -1415,17 +1446,25 @@ class Wrapper:
             # invalid price for a new order must cancel it
             isWarning = False
 
-        msg = (
-            f'{"Warning" if isWarning else "Error"} '
-            f'{errorCode}, reqId {reqId}: {errorString}'
-        )
         contract = self._reqId2Contract.get(reqId)
-        if contract:
-            msg += f", contract: {contract}"
 
         if isWarning:
-            self._logger.info(msg)
+            if contract:
+                self._logger.info(
+                    "Warning %s, reqId %s: %s, contract: %s",
+                    errorCode,
+                    reqId,
+                    errorString,
+                    contract,
+                )
+            else:
+                self._logger.info(
+                    "Warning %s, reqId %s: %s", errorCode, reqId, errorString
+                )
         else:
+            msg = f"Error {errorCode}, reqId {reqId}: {errorString}"
+            if contract:
+                msg += f", contract: {contract}"
             self._logger.error(msg)
             if isRequest:
                 # the request failed
@@ -1515,7 +1554,10 @@ class Wrapper:
     def tcpDataProcessed(self):
         self.ib.updateEvent.emit()
         if self.pendingTickers:
+            lastTime = self.lastTime
             for ticker in self.pendingTickers:
-                ticker.time = self.lastTime
-                ticker.updateEvent.emit(ticker)
+                ticker.time = lastTime
+                event = ticker.updateEvent
+                if len(event):
+                    event.emit(ticker)
             self.ib.pendingTickersEvent.emit(self.pendingTickers)
@@ -0,0 +1,66 @@
+import datetime as dt
+import random
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from ib_async import util
+
+
+def test_parse_date():
+    assert util.parseIBDatetime("20230102") == dt.date(2023, 1, 2)
+
+
+def test_parse_datetime():
+    assert util.parseIBDatetime("20230102 10:11:12") == dt.datetime(
+        2023, 1, 2, 10, 11, 12
+    )
+
+
+def test_parse_datetime_double_space():
+    assert util.parseIBDatetime("20230102  10:11:12") == dt.datetime(
+        2023, 1, 2, 10, 11, 12
+    )
+
+
+def test_parse_datetime_dashes_and_fraction():
+    assert util.parseIBDatetime("2023-01-02 10:11:12.0") == dt.datetime(
+        2023, 1, 2, 10, 11, 12
+    )
+
+
+def test_parse_datetime_with_timezone():
+    t = util.parseIBDatetime("20221125 10:00:00 Europe/Amsterdam")
+    assert t == dt.datetime(2022, 11, 25, 10, tzinfo=ZoneInfo("Europe/Amsterdam"))
+    assert t.tzinfo == ZoneInfo("Europe/Amsterdam")
+
+
+def test_parse_epoch_seconds():
+    t = util.parseIBDatetime("1700000000")
+    assert t == dt.datetime(2023, 11, 14, 22, 13, 20, tzinfo=dt.timezone.utc)
+
+
+def test_parse_datetime_strptime_fallback():
+    # single-digit hour doesn't fit the sliced layout
+    assert util.parseIBDatetime("20230102 9:05:07") == dt.datetime(
+        2023, 1, 2, 9, 5, 7
+    )
+    with pytest.raises(ValueError):
+        util.parseIBDatetime("20230132 10:11:12")
+    with pytest.raises(ValueError):
+        util.parseIBDatetime("2023010210-11-12")
+
+
+def test_parse_datetime_matches_strptime():
+    rng = random.Random(12345)
+    start = dt.datetime(1990, 1, 1)
+    for _ in range(10000):
+        t = start + dt.timedelta(seconds=rng.randrange(60 * 365 * 24 * 3600))
+        s = t.strftime("%Y%m%d %H:%M:%S")
+        expected = dt.datetime.strptime(s, "%Y%m%d %H:%M:%S")
+        assert util.parseIBDatetime(s) == expected
+        assert util.parseIBDatetime(s.replace(" ", "  ")) == expected
+        tz = s + " US/Eastern"
+        assert util.parseIBDatetime(tz) == expected.replace(
+            tzinfo=ZoneInfo("US/Eastern")
+        )
@@ -0,0 +1,25 @@
+import random
+
+import ib_async as ibi
+
+
+def test_mkt_depth_lists_follow_dicts():
+    ib = ibi.IB()
+    wrapper = ib.wrapper
+    ticker = wrapper.startTicker(1, ibi.Stock("AAPL", "SMART", "USD"), "mktDepth")
+
+    rng = random.Random(12345)
+    for _ in range(20000):
+        side = rng.randint(0, 1)
+        dom = ticker.domBidsDict if side else ticker.domAsksDict
+        operation = rng.choice((0, 0, 1, 2))
+        if operation == 2 and dom and rng.random() < 0.8:
+            position = rng.choice(list(dom))
+        else:
+            position = rng.randint(0, len(dom) + 1)
+        price = round(rng.uniform(90, 110), 2)
+        size = float(rng.randint(1, 500))
+        wrapper.updateMktDepthL2(1, position, "MM", operation, side, price, size)
+
+        assert ticker.domBids == list(ticker.domBidsDict.values())
+        assert ticker.domAsks == list(ticker.domAsksDict.values())